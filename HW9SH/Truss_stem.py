@@ -1,8 +1,45 @@
+import io
 import math
+import numpy as np
 from PyQt5 import QtWidgets as qtw
 from PyQt5 import QtCore as qtc
 from PyQt5 import QtGui as qtg
 
+try:  # numba is optional.  Without it, calcLinkVals uses the NumPy version.
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _calc_link_vals(nx, ny, i1, i2, L, A):
+    """
+    Loop kernel for TrussController.calcLinkVals.  Fills L with the length and A with the angle (in [0, 2*pi)) of
+    each link k running from node i1[k] to node i2[k].  Links with a negative node index are left as nan.
+    :param nx: node x coordinates
+    :param ny: node y coordinates
+    :param i1: index of node 1 of each link
+    :param i2: index of node 2 of each link
+    :param L: output array of link lengths
+    :param A: output array of link angles in radians
+    """
+    for k in range(i1.size):
+        if i1[k] < 0 or i2[k] < 0:
+            L[k] = np.nan
+            A[k] = np.nan
+            continue
+        dx = nx[i2[k]] - nx[i1[k]]
+        dy = ny[i2[k]] - ny[i1[k]]
+        L[k] = math.sqrt(dx * dx + dy * dy)
+        a = math.atan2(dy, dx)
+        A[k] = a + 2.0 * math.pi if a < 0.0 else a
+
+
+if njit is not None:
+    _calc_link_vals = njit(cache=True, fastmath=True, error_model='numpy')(_calc_link_vals)
+    # compile now with a dummy call so the first file opened doesn't pay for the JIT
+    _calc_link_vals(np.zeros(2), np.zeros(2), np.zeros(1, dtype=np.intp), np.ones(1, dtype=np.intp),
+                    np.empty(1), np.empty(1))
+
 
 class Position():
     """
@@ -10,6 +47,7 @@ class Position():
     vector arithmitic and vector algebra (i.e., a dot product).  I could have used a numpy array, but I wanted
     to create my own.  This class uses operator overloading as explained in the class.
     """
+    __slots__ = ('x', 'y', 'z')
 
     def __init__(self, pos=None, x=None, y=None, z=None):
         """
@@ -19,18 +57,29 @@ class Position():
         :param y: float
         :param z: float
         """
-        # set default values
-        self.x = 0.0
-        self.y = 0.0
-        self.z = 0.0
-        # unpack position from a tuple if given
+        # unpack position from a tuple if given, otherwise set default values
         if pos is not None:
             self.x, self.y, self.z = pos
+        else:
+            self.x = 0.0
+            self.y = 0.0
+            self.z = 0.0
         # override the x,y,z defaults if they are given as arguments
         self.x = x if x is not None else self.x
         self.y = y if y is not None else self.y
         self.z = z if z is not None else self.z
 
+    @classmethod
+    def _new(cls, x, y, z):
+        """
+        Fast constructor for the operator overloads.  Skips the tuple/keyword handling in __init__.
+        """
+        p = cls.__new__(cls)
+        p.x = x
+        p.y = y
+        p.z = z
+        return p
+
     # region operator overloads $NEW$ 4/7/21
     def __eq__(self, other):
         if self.x != other.x:
@@ -44,11 +93,11 @@ class Position():
     # this is overloading the addition operator.  Allows me to add Position objects with simple math: c=a+b, where
     # a, b, and c are all position objects.
     def __add__(self, other):
-        return Position((self.x + other.x, self.y + other.y, self.z + other.z))
+        return Position._new(self.x + other.x, self.y + other.y, self.z + other.z)
 
     # this overloads the iterative add operator
     def __iadd__(self, other):
-        if other in (float, int):
+        if isinstance(other, (int, float)):
             self.x += other
             self.y += other
             self.z += other
@@ -58,14 +107,15 @@ class Position():
             self.y += other.y
             self.z += other.z
             return self
+        return NotImplemented
 
     # this is overloading the subtraction operator.  Allows me to subtract Positions. (i.e., c=b-a)
     def __sub__(self, other):
-        return Position((self.x - other.x, self.y - other.y, self.z - other.z))
+        return Position._new(self.x - other.x, self.y - other.y, self.z - other.z)
 
     # this overloads the iterative subtraction operator
     def __isub__(self, other):
-        if other in (float, int):
+        if isinstance(other, (int, float)):
             self.x -= other
             self.y -= other
             self.z -= other
@@ -75,13 +125,14 @@ class Position():
             self.y -= other.y
             self.z -= other.z
             return self
+        return NotImplemented
 
     # this is overloading the multiply operator.  Allows me to multiply a scalar or do a dot product (i.e., b=s*a or c=b*a)
     def __mul__(self, other):
         if type(other) in (float, int):
-            return Position((self.x * other, self.y * other, self.z * other))
+            return Position._new(self.x * other, self.y * other, self.z * other)
         if type(other) is Position:
-            return Position((self.x * other.x, self.y * other.y, self.z * other.z))
+            return Position._new(self.x * other.x, self.y * other.y, self.z * other.z)
 
     # this is overloading the __rmul__ operator so that s*Pt works.
     def __rmul__(self, other):
@@ -89,24 +140,26 @@ class Position():
 
     # this is overloading the *= operator.  Same as a = Position((a.x*other, a.y*other, a.z*other))
     def __imul__(self, other):
-        if type(other) in (float, int):
+        if isinstance(other, (int, float)):
             self.x *= other
             self.y *= other
             self.z *= other
             return self
+        return NotImplemented
 
     # this is overloading the division operator.  Allows me to divide by a scalar (i.e., b=a/s)
     def __truediv__(self, other):
         if type(other) in (float, int):
-            return Position((self.x / other, self.y / other, self.z / other))
+            return Position._new(self.x / other, self.y / other, self.z / other)
 
     # this is overloading the /= operator.  Same as a = Position((a.x/other, a.y/other, a.z/other))
-    def __idiv__(self, other):
-        if type(other) in (float, int):
+    def __itruediv__(self, other):
+        if isinstance(other, (int, float)):
             self.x /= other
             self.y /= other
             self.z /= other
             return self
+        return NotImplemented
 
     # endregion
 
@@ -131,25 +184,22 @@ class Position():
         return '{}, {}, {}'.format(round(self.x, nPlaces), round(self.y, nPlaces), round(self.z, nPlaces))
 
     def mag(self):  # normal way to calculate magnitude of a vector
-        return (self.x ** 2 + self.y ** 2 + self.z ** 2) ** 0.5
+        x, y, z = self.x, self.y, self.z
+        return math.sqrt(x * x + y * y + z * z)
 
     def normalize(self):  # typical way to normalize to a unit vector
         l = self.mag()
         if l <= 0.0:
             return
-        self.__idiv__(l)
+        self /= l
 
     def getAngleRad(self):
         """
         Gets angle of position relative to an origin (0,0) in the x-y plane
         :return: angle in x-y plane in radians
         """
-        l = self.mag()
-        if l <= 0.0:
-            return 0
-        if self.y >= 0.0:
-            return math.acos(self.x / l)
-        return 2.0 * math.pi - math.acos(self.x / l)
+        a = math.atan2(self.y, self.x)
+        return a + 2.0 * math.pi if a < 0.0 else a
 
     def getAngleDeg(self):
         """
@@ -159,6 +209,119 @@ class Position():
         return 180.0 / math.pi * self.getAngleRad()
 
 
+class Position2D():
+    """
+    A 2D version of Position for the truss, which only ever uses x and y.  It has no z to carry around, so the
+    arithmetic does a third less work and each instance is smaller.  Otherwise it has the same operators and methods
+    as Position.
+    """
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x=0.0, y=0.0):
+        self.x = x
+        self.y = y
+
+    # region operator overloads
+    def __eq__(self, other):
+        return self.x == other.x and self.y == other.y
+
+    def __add__(self, other):
+        return Position2D(self.x + other.x, self.y + other.y)
+
+    def __iadd__(self, other):
+        if isinstance(other, (int, float)):
+            self.x += other
+            self.y += other
+            return self
+        if isinstance(other, Position2D):
+            self.x += other.x
+            self.y += other.y
+            return self
+        return NotImplemented
+
+    def __sub__(self, other):
+        return Position2D(self.x - other.x, self.y - other.y)
+
+    def __isub__(self, other):
+        if isinstance(other, (int, float)):
+            self.x -= other
+            self.y -= other
+            return self
+        if isinstance(other, Position2D):
+            self.x -= other.x
+            self.y -= other.y
+            return self
+        return NotImplemented
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)):
+            return Position2D(self.x * other, self.y * other)
+        if isinstance(other, Position2D):
+            return Position2D(self.x * other.x, self.y * other.y)
+        return NotImplemented
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __imul__(self, other):
+        if isinstance(other, (int, float)):
+            self.x *= other
+            self.y *= other
+            return self
+        return NotImplemented
+
+    def __truediv__(self, other):
+        if isinstance(other, (int, float)):
+            return Position2D(self.x / other, self.y / other)
+        return NotImplemented
+
+    def __itruediv__(self, other):
+        if isinstance(other, (int, float)):
+            self.x /= other
+            self.y /= other
+            return self
+        return NotImplemented
+
+    # endregion
+
+    def set(self, strXY=None, tupXY=None):
+        # set position by string or tuple
+        if strXY is not None:
+            cells = strXY.replace('(', '').replace(')', '').strip().split(',')
+            self.x = float(cells[0])
+            self.y = float(cells[1])
+        elif tupXY is not None:
+            x, y = tupXY
+            self.x = float(x)
+            self.y = float(y)
+
+    def getTup(self):  # return (x,y) as a tuple
+        return (self.x, self.y)
+
+    def getStr(self, nPlaces=3):
+        return '{}, {}'.format(round(self.x, nPlaces), round(self.y, nPlaces))
+
+    def mag(self):
+        return math.hypot(self.x, self.y)
+
+    def normalize(self):
+        l = self.mag()
+        if l <= 0.0:
+            return
+        self /= l
+
+    def getAngleRad(self):
+        """
+        Gets angle of position relative to an origin (0,0)
+        :return: angle in radians in [0, 2*pi)
+        """
+        a = math.atan2(self.y, self.x)
+        return a + 2.0 * math.pi if a < 0.0 else a
+
+    def getAngleDeg(self):
+        return 180.0 / math.pi * self.getAngleRad()
+
+
 class Material():
     def __init__(self, uts=None, ys=None, modulus=None, staticFactor=None):
         self.uts = uts
@@ -168,9 +331,11 @@ class Material():
 
 
 class Node():
+    __slots__ = ('name', 'position')
+
     def __init__(self, name=None, position=None):
         self.name = name
-        self.position = position if position is not None else Position()
+        self.position = position if position is not None else Position2D()
 
     def __eq__(self, other):
         """
@@ -187,14 +352,63 @@ class Node():
 class Link():
     def __init__(self, name="", node1="1", node2="2", length=None, angleRad=None):
         """
-        Basic definition of a link contains a name and names of node1 and node2
+        Basic definition of a link contains a name and names of node1 and node2.  Once the link is bound to a
+        TrussModel (see TrussModel.buildArrays), length and angleRad are read from and written to the model's
+        links_length and links_angle arrays, so the Link object is just a view into those arrays.
         """
+        self._truss = None
+        self._idx = None
         self.name = ""
         self.node1_Name = node1
         self.node2_Name = node2
         self.length = None
         self.angleRad = None
 
+    def bind(self, truss, idx):
+        """
+        Attach this link to row idx of the struct-of-arrays storage in truss.
+        """
+        self._truss = truss
+        self._idx = idx
+
+    def unbind(self):
+        """
+        Detach this link from its truss, keeping the current length and angleRad on the link itself.
+        """
+        length, angleRad = self.length, self.angleRad
+        self._truss = None
+        self._idx = None
+        self.length = length
+        self.angleRad = angleRad
+
+    @property
+    def length(self):
+        if self._truss is None:
+            return self._length
+        v = self._truss.links_length[self._idx]
+        return None if np.isnan(v) else float(v)
+
+    @length.setter
+    def length(self, value):
+        if self._truss is None:
+            self._length = value
+        else:
+            self._truss.links_length[self._idx] = np.nan if value is None else value
+
+    @property
+    def angleRad(self):
+        if self._truss is None:
+            return self._angleRad
+        v = self._truss.links_angle[self._idx]
+        return None if np.isnan(v) else float(v)
+
+    @angleRad.setter
+    def angleRad(self, value):
+        if self._truss is None:
+            self._angleRad = value
+        else:
+            self._truss.links_angle[self._idx] = np.nan if value is None else value
+
     def __eq__(self, other):
         """
         This overloads the == operator for comparing equivalence of two links.
@@ -218,17 +432,81 @@ class TrussModel():
         self.links = []
         self.nodes = []
         self.material = Material()
+        # name -> position in self.nodes, and the set of link names, so lookups don't scan the lists
+        self._node_index = {}
+        self._link_names = set()
+        # struct-of-arrays copies of the node coordinates and link connectivity.  The lists above are used while
+        # reading the file, then buildArrays() flushes them into these arrays for the vectorized calculations.
+        # _dirty is set whenever the lists change so TrussController.calcLinkVals knows to rebuild the arrays.
+        self._dirty = True
+        self.nodes_x = np.empty(0)
+        self.nodes_y = np.empty(0)
+        self.links_n1_idx = np.empty(0, dtype=np.intp)
+        self.links_n2_idx = np.empty(0, dtype=np.intp)
+        self.links_length = np.empty(0)
+        self.links_angle = np.empty(0)
+
+    def clear(self):
+        # links from the old truss must not keep reading rows of the new arrays
+        for l in self.links:
+            l.unbind()
+        self.links.clear()
+        self.nodes.clear()
+        self._node_index.clear()
+        self._link_names.clear()
+        self._dirty = True
+
+    def addNode(self, node):
+        self._node_index[node.name] = len(self.nodes)
+        self.nodes.append(node)
+        self._dirty = True
+
+    def hasNode(self, name):
+        return name in self._node_index
 
     def getNode(self, name):
-        for n in self.nodes:
-            if n.name == name:
-                return n
+        i = self._node_index.get(name)
+        return None if i is None else self.nodes[i]
+
+    def addLink(self, link):
+        self._link_names.add(link.name)
+        self.links.append(link)
+        self._dirty = True
+
+    def hasLink(self, name):
+        return name in self._link_names
+
+    def buildArrays(self):
+        """
+        Copies the node positions and the link node indices into the struct-of-arrays storage and binds each Link
+        to its row so that link.length and link.angleRad read from links_length and links_angle.
+        """
+        self.nodes_x = np.array([n.position.x for n in self.nodes], dtype=np.float64)
+        self.nodes_y = np.array([n.position.y for n in self.nodes], dtype=np.float64)
+        # one pass over the links with a single dict probe per node.  A link to a missing node gets index -1 and
+        # is skipped by calcLinkVals.
+        index = self._node_index
+        n1 = []
+        n2 = []
+        for i, l in enumerate(self.links):
+            n1.append(index.get(l.node1_Name, -1))
+            n2.append(index.get(l.node2_Name, -1))
+            l.bind(self, i)
+        self.links_n1_idx = np.array(n1, dtype=np.intp)
+        self.links_n2_idx = np.array(n2, dtype=np.intp)
+        self.links_length = np.full(len(self.links), np.nan)
+        self.links_angle = np.full(len(self.links), np.nan)
+        self._dirty = False
 
 
 class TrussController():
     def __init__(self):
         self.truss = TrussModel()
         self.view = TrussView()
+        # keyword at the start of a line in the input file -> method that reads that line.  node and link lines are
+        # not in here since they are collected and read after the first pass (see ImportFromFile).
+        self.lineHandlers = {'title': self.importTitle, 'material': self.importMaterial,
+                             'static_factor': self.importSF}
 
     def ImportFromFile(self, data):
         """
@@ -242,43 +520,39 @@ class TrussController():
         contain the node, I append it to the list of nodes
 
         Reading Links:
-        The links should come after the nodes.  Each link has a name and two node names.  See method addLink
+        Each link has a name and two node names.  See method addLink
+
+        Each line is classified by its first comma- or space-separated field (the keyword) and dispatched through
+        self.lineHandlers.  The node and link lines are collected on the first pass through data.  The node block is
+        then parsed in one call (see importNodes) and the links are read after all the nodes are known.
         """
 
         Index = 0
-        self.truss.links.clear()
-        self.truss.nodes.clear()
+        nodeLines = []
+        linkLines = []
+        self.truss.clear()
         self.truss.title = None
         self.truss.material.uts = None
         self.truss.material.ys = None
         self.truss.material.E = None
         self.truss.material.staticFactor = 0
 
+        collect = {'node': nodeLines, 'link': linkLines}
         while Index < len(data):
-            lin = '' + data[Index]
-            lin = lin.lower().strip()
-            # read in a pipe
-            if lin.find('#') == 0:
-                n = 1
-                pass
-            elif lin.find('title') >= 0:
-                self.importTitle(data, Index)
-                pass
-            elif lin.find('link') >= 0:
-                # read in a pipe and increase Index to end of pipe section
-                self.importLink(data, Index)
-                pass
-            elif lin.find('node') >= 0:
-                self.importNode(data, Index)
-                pass
-            elif lin.find('material') >= 0:
-                self.importMaterial(data, Index)
-                pass
-            elif lin.find('static_factor') >= 0:
-                self.importSF(data, Index)
-                pass
+            lin = data[Index].strip()
+            # the keyword ends at the first comma or whitespace.  Comment and blank lines have no keyword.
+            words = lin.replace(',', ' ').split(None, 1)
+            key = '' if lin.startswith('#') or len(words) == 0 else words[0].lower()
+            handler = self.lineHandlers.get(key)
+            if handler is not None:
+                handler(data, Index)
+            elif key in collect:
+                collect[key].append(Index)
             Index += 1
 
+        self.importNodes(data, nodeLines)
+        for j in linkLines:
+            self.importLink(data, j)
         self.calcLinkVals()
         self.displayReport()
         self.drawTruss()
@@ -299,7 +573,7 @@ class TrussController():
         target.title = title
         pass
 
-    def importMaterial(self, data, j, TM=TrussModel()):
+    def importMaterial(self, data, j, TM=None):
         """
         Imports the material from the "Truss Design Inpot File.txt" for uses in the program
         """
@@ -311,7 +585,7 @@ class TrussController():
         self.truss.material.E = float(parts[3].strip(','))
         pass
 
-    def importSF(self, data, j, TM=TrussModel()):
+    def importSF(self, data, j, TM=None):
         """
         Imports the static factor from the "Truss Design Inpot File.txt" for uses in the program
         """
@@ -321,7 +595,7 @@ class TrussController():
         self.truss.material.staticFactor = float(parts[1].strip(','))
         pass
 
-    def importLink(self, data, j, TM=TrussModel()):
+    def importLink(self, data, j, TM=None):
         """
         Imports the links from the "Truss Design Inpot File.txt" for uses in the program
         """
@@ -332,62 +606,71 @@ class TrussController():
         name = parts[1].strip(',')
         node1 = parts[2].strip(',')
         node2 = parts[3].strip(',')
-        run = True
-        for l in self.truss.links:
-            if l.name == name:
-                run = False
-        if self.hasNode(node1) and self.hasNode(node2) and run == True:
+        if self.hasNode(node1) and self.hasNode(node2) and not self.truss.hasLink(name):
             L.name = name
             L.node1_Name = node1
             L.node2_Name = node2
             self.addLink(L)
         pass
 
-    def importNode(self, data, j, TM=TrussModel()):
+    def importNodes(self, data, rows):
         """
-        Imports the nodes from the "Truss Design Input File.txt" for uses in the program
+        Imports the nodes from the "Truss Design Input File.txt" for uses in the program.  All the node lines
+        data[j] for j in rows are read at once: the x and y columns are parsed in a single np.loadtxt call instead of
+        calling float() on each line.  Lines without enough fields are reported and skipped.
+        :param data: list of strings read from the data file
+        :param rows: indices of the node lines in data
         """
-        parts = [p.strip() for p in data[j].strip().split(',')]
-        if len(parts) >= 4:
-            name = parts[1]  # Extract the node name
+        lines = []
+        for j in rows:
+            if data[j].count(',') >= 3:
+                lines.append(data[j].strip())
+            else:
+                print("Invalid node data at line:", j)
+        if len(lines) == 0:
+            return
+        names = [l.split(',')[1].strip() for l in lines]
+        xy = np.loadtxt(io.StringIO('\n'.join(lines)), delimiter=',', usecols=(2, 3), dtype=np.float64, ndmin=2)
+        for name, x, y in zip(names, xy[:, 0].tolist(), xy[:, 1].tolist()):
             if not self.hasNode(name=name):
-                N = Node()
-                N.name = name
-                N.position.x = float(parts[2])
-                N.position.y = float(parts[3])
-                self.addNode(N)
-        else:
-            print("Invalid node data at line:", j)
+                self.addNode(Node(name=name, position=Position2D(x, y)))
 
     def hasNode(self, name):
-        for n in self.truss.nodes:
-            if n.name == name:
-                return True
-        return False
+        return self.truss.hasNode(name)
 
     def addNode(self, node):
-        self.truss.nodes.append(node)
+        self.truss.addNode(node)
 
     def getNode(self, name):
-        for n in self.truss.nodes:
-            if n.name == name:
-                return n
+        return self.truss.getNode(name)
 
     def addLink(self, link):
-        self.truss.links.append(link)
+        self.truss.addLink(link)
 
     def calcLinkVals(self):
-        for l in self.truss.links:
-            n1 = None
-            n2 = None
-            if self.hasNode(l.node1_Name):
-                n1 = self.getNode(l.node1_Name)
-            if self.hasNode(l.node2_Name):
-                n2 = self.getNode(l.node2_Name)
-            if n1 is not None and n2 is not None:
-                r = n2.position - n1.position
-                l.length = r.mag()
-                l.angleRad = r.getAngleRad()
+        """
+        Calculates the length and angle of every link in one vectorized pass over the struct-of-arrays storage.
+        Angles are in the range [0, 2*pi) to match Position.getAngleRad.  Uses the compiled _calc_link_vals kernel
+        when numba is available.  The results are written into the links_length and links_angle arrays that
+        TrussModel.buildArrays sized for the links.  The arrays are rebuilt first if nodes or links were added since
+        the last build.
+        """
+        t = self.truss
+        if t._dirty:
+            t.buildArrays()
+        if njit is not None:
+            _calc_link_vals(t.nodes_x, t.nodes_y, t.links_n1_idx, t.links_n2_idx, t.links_length, t.links_angle)
+            return
+        valid = (t.links_n1_idx >= 0) & (t.links_n2_idx >= 0)
+        i1 = t.links_n1_idx[valid]
+        i2 = t.links_n2_idx[valid]
+        dx = t.nodes_x[i2] - t.nodes_x[i1]
+        dy = t.nodes_y[i2] - t.nodes_y[i1]
+        t.links_length[~valid] = np.nan
+        t.links_angle[~valid] = np.nan
+        t.links_length[valid] = np.hypot(dx, dy)
+        a = np.arctan2(dy, dx)
+        t.links_angle[valid] = np.where(a < 0.0, a + 2.0 * np.pi, a)
 
     def setDisplayWidgets(self, args):
         self.view.setDisplayWidgets(args)
@@ -419,6 +702,11 @@ class TrussView():
         self.penNode = qtg.QPen(qtc.Qt.darkBlue)
         self.penNode.setStyle(qtc.Qt.SolidLine)
         self.penNode.setWidth(1)
+        # a darkMagenta pen for the node labels
+        self.penNodeLabel = qtg.QPen(qtc.Qt.darkMagenta)
+        # a default pen for when none is given, and outline pens for label backgrounds keyed by rgba
+        self._defaultPen = qtg.QPen()
+        self._labelBgPenCache = {}
         # a pen for the grid lines
         self.penGridLines = qtg.QPen()
         self.penGridLines.setWidth(1)
@@ -433,6 +721,11 @@ class TrussView():
         self.brushGrid = qtg.QBrush(qtg.QColor.fromHsv(87, 98, 245, alpha=128))
         # endregion
 
+        # font metrics and the default text document margin, so drawALabel can size a label without asking the
+        # text item for its boundingRect
+        self._fm = qtg.QFontMetricsF(qtg.QFont())
+        self._labelMargin = qtg.QTextDocument().documentMargin()
+
     def setDisplayWidgets(self, args):
         self.te_Report = args[0]
         self.le_LongLinkName = args[1]
@@ -443,37 +736,34 @@ class TrussView():
         self.gv.setScene(self.scene)
 
     def displayReport(self, truss=None):
-        st = '\tTruss Design Report\n'
-        st += 'Title:  {}\n'.format(truss.title)
-        st += 'Static Factor of Safety:  {:0.2f}\n'.format(truss.material.staticFactor)
-        st += 'Ultimate Strength:  {:0.2f}\n'.format(truss.material.uts)
-        st += 'Yield Strength:  {:0.2f}\n'.format(truss.material.ys)
-        st += 'Modulus of Elasticity:  {:0.2f}\n'.format(truss.material.E)
-        st += '_____________Link Summary________________\n'
-        st += 'Link\t(1)\t(2)\tLength\tAngle\n'
-        longest = None
-        for l in truss.links:
-            if longest is None or l.length > longest.length:
-                longest = l
-            st += '{}\t{}\t{}\t{:0.2f}\t{:0.2f}\n'.format(l.name, l.node1_Name, l.node2_Name, l.length, l.angleRad)
-        self.te_Report.setText(st)
+        # build the report as a list of lines and join once at the end
+        rows = ['\tTruss Design Report',
+                'Title:  {}'.format(truss.title),
+                'Static Factor of Safety:  {:0.2f}'.format(truss.material.staticFactor),
+                'Ultimate Strength:  {:0.2f}'.format(truss.material.uts),
+                'Yield Strength:  {:0.2f}'.format(truss.material.ys),
+                'Modulus of Elasticity:  {:0.2f}'.format(truss.material.E),
+                '_____________Link Summary________________',
+                'Link\t(1)\t(2)\tLength\tAngle']
+        rows += ['{}\t{}\t{}\t{:0.2f}\t{:0.2f}'.format(l.name, l.node1_Name, l.node2_Name, L, A)
+                 for l, L, A in zip(truss.links, truss.links_length.tolist(), truss.links_angle.tolist())]
+        self.te_Report.setText('\n'.join(rows) + '\n')
+        # links without a length are nan in links_length, so nanargmax skips them
+        longest = truss.links[int(np.nanargmax(truss.links_length))]
         self.le_LongLinkName.setText(longest.name)
         self.le_LongLinkLength.setText("{:0.2f}".format(longest.length))
         self.le_LongLinkNode1.setText(longest.node1_Name)
         self.le_LongLinkNode2.setText(longest.node2_Name)
 
     def buildScene(self, truss=None):
-        # Create a QRect() object to help with drawing the background grid.
+        # Create a QRect() object to help with drawing the background grid.  The bounding box of the nodes comes
+        # from NumPy reductions over the node coordinate arrays.  Note top is the max y since y points up.
+        xmin = math.floor(truss.nodes_x.min())
+        xmax = math.ceil(truss.nodes_x.max())
+        ymin = math.floor(truss.nodes_y.min())
+        ymax = math.ceil(truss.nodes_y.max())
         rect = qtc.QRect()
-        rect.setTop(int(truss.nodes[0].position.y))
-        rect.setLeft(int(truss.nodes[0].position.x))
-        rect.setHeight(0)
-        rect.setWidth(0)
-        for n in truss.nodes:
-            if n.position.y > rect.top(): rect.setTop(int(n.position.y))
-            if n.position.y < rect.bottom(): rect.setBottom(n.position.y)
-            if n.position.x > rect.right(): rect.setRight(int(n.position.x))
-            if n.position.x < rect.left(): rect.setLeft(n.position.x)
+        rect.setCoords(xmin, ymax, xmax, ymin)
         rect.adjust(-50, 50, 50, -50)
 
         # clear out the old scene first
@@ -508,7 +798,7 @@ class TrussView():
         bottom = self.scene.sceneRect().bottom() if CenterY is None else (CenterY + height / 2.0)
         dx = DeltaX
         dy = DeltaY
-        p = qtg.QPen() if Pen is None else Pen
+        p = self._defaultPen if Pen is None else Pen
 
         # background
         if brush is not None:
@@ -516,20 +806,21 @@ class TrussView():
             rectangle.setBrush(brush)
             rectangle.setPen(p)
             self.scene.addItem(rectangle)
+        # all the grid lines go into one path so the scene gets a single item
+        path = qtg.QPainterPath()
         # vertical lines
         x = left
         while x <= right:
-            vertical = qtw.QGraphicsLineItem(x, top, x, bottom)
-            vertical.setPen(p)
-            self.scene.addItem(vertical)
+            path.moveTo(x, top)
+            path.lineTo(x, bottom)
             x += dx
         # horizontal lines
         y = top
         while y <= bottom:
-            horizontal = qtw.QGraphicsLineItem(left, y, right, y)
-            horizontal.setPen(p)
-            self.scene.addItem(horizontal)
+            path.moveTo(left, y)
+            path.lineTo(right, y)
             y += dy
+        self.scene.addPath(path, p)
 
         pass
 
@@ -546,16 +837,14 @@ class TrussView():
     def drawNodes(self, truss=None, scene=None):
         if scene is None:
             scene = self.scene
-        pn = self.penNode
-        bn = self.brushNode
-        pn_outline = qtg.QPen() if pn is None else pn
-        pn_label = qtg.QPen(qtc.Qt.darkMagenta)
-        bn_fill = qtg.QBrush() if bn is None else bn
+        # reuse the pens and brush made in __init__
+        pn_outline = self.penNode
+        pn_label = self.penNodeLabel
+        bn_fill = self.brushNode
         for node in truss.nodes:
             x = node.position.x
             y = node.position.y
 
-            ToolTip = 'Node {}: {} \n'.format(node.name, truss.nodes)
             self.drawACircle(x, y, 7, brush=bn_fill, pen=pn_outline, name=('node: ' + node.name))
             self.drawALabel(x - 15, y + 15, str=node.name, pen=pn_label)
         pass
@@ -563,10 +852,10 @@ class TrussView():
     def drawALabel(self, x, y, str='', pen=None, brush=None, tip=None):
 
         scene = self.scene
+        # Identifying labels for width and height from the cached font metrics (text plus the document margin)
+        W = self._fm.horizontalAdvance(str) + 2.0 * self._labelMargin
+        H = self._fm.height() + 2.0 * self._labelMargin
         lbl = qtw.QGraphicsTextItem(str)
-        # Identifying labels for width and height
-        W = lbl.boundingRect().width()
-        H = lbl.boundingRect().height()
         lbl.setX(x - W / 2.0)
         lbl.setY(-y - H / 2.0)
         # Setting the tip, pen, and brush based on user input
@@ -578,7 +867,10 @@ class TrussView():
             # Making a background that makes the image look neater
             background = qtw.QGraphicsRectItem(lbl.x(), lbl.y(), W, H)
             background.setBrush(brush)
-            pen_outline = qtg.QPen(brush.color())
+            color = brush.color()
+            pen_outline = self._labelBgPenCache.get(color.rgba())
+            if pen_outline is None:
+                pen_outline = self._labelBgPenCache[color.rgba()] = qtg.QPen(color)
             background.setPen(pen_outline)
             scene.addItem(background)
         scene.addItem(lbl)